@@ -46,7 +46,8 @@ provides:
 
 
 import logging
-from typing import Union
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
 
 from ops.charm import (
     CharmBase,
@@ -54,16 +55,21 @@ from ops.charm import (
     RelationJoinedEvent,
     UpgradeCharmEvent,
 )
-from ops.framework import Object
+from ops.framework import BoundEvent, Object
 from ops.model import (
     ActiveStatus,
     BlockedStatus,
+    Container,
     MaintenanceStatus,
     ModelError,
     Relation,
+    StatusBase,
     WaitingStatus,
 )
-from ops.pebble import Layer
+from ops.pebble import Layer, Plan, Service
+
+if TYPE_CHECKING:
+    from ops.pebble import ServiceDict
 
 # The unique Charmhub library identifier, never change it
 LIBID = "bb3ed1ffc47848b386301b42c94acac2"
@@ -73,11 +79,39 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 15
+LIBPATCH = 16
 
 
 logger = logging.getLogger(__name__)
 
+_ACTIVE_STATUS = ActiveStatus()
+
+
+@lru_cache(maxsize=32)
+def _blocked_status(message: str) -> BlockedStatus:
+    """Returns a shared BlockedStatus instance for the given message.
+
+    Args:
+        message (str): Status message
+
+    Returns:
+        BlockedStatus: Blocked status
+    """
+    return BlockedStatus(message)
+
+
+@lru_cache(maxsize=32)
+def _waiting_status(message: str) -> WaitingStatus:
+    """Returns a shared WaitingStatus instance for the given message.
+
+    Args:
+        message (str): Status message
+
+    Returns:
+        WaitingStatus: Waiting status
+    """
+    return WaitingStatus(message)
+
 
 class Orc8rBase(Object):
     """Instantiated by Orchestrator charms."""
@@ -94,26 +128,21 @@ class Orc8rBase(Object):
         self.charm = charm
         self.startup_command = startup_command
         self.required_relations = required_relations or []
-        self.container_name = self.service_name = self.charm.meta.name
-        service_name_with_underscores = self.service_name.replace("-", "_")
-        provided_relations = self.charm.meta.provides.keys()
-        if self.container_name in provided_relations:
-            service_status_relation_name = self.container_name
-            service_status_relation_name_with_underscores = service_status_relation_name.replace(
-                "-", "_"
-            )
-            relation_joined_event = getattr(
-                self.charm.on, f"{service_status_relation_name_with_underscores}_relation_joined"
-            )
-            self.framework.observe(relation_joined_event, self._on_relation_joined)
-        pebble_ready_event = getattr(
-            self.charm.on, f"{service_name_with_underscores}_pebble_ready"
-        )
-        self.container = self.charm.unit.get_container(self.container_name)
-        self.framework.observe(pebble_ready_event, self._configure_workload)
-        self.framework.observe(self.charm.on.upgrade_charm, self._configure_workload)
+        name = charm.meta.name
+        self.container_name = self.service_name = name
+        underscored = name.replace("-", "_")
+        observers: List[Tuple[BoundEvent, Callable]] = [
+            (getattr(self.charm.on, f"{underscored}_pebble_ready"), self._configure_workload),
+            (self.charm.on.upgrade_charm, self._configure_workload),
+        ]
+        if name in charm.meta.provides:
+            relation_joined_event = getattr(self.charm.on, f"{underscored}_relation_joined")
+            observers.append((relation_joined_event, self._on_relation_joined))
+        for event, handler in observers:
+            self.framework.observe(event, handler)
 
         self.additional_environment_variables = additional_environment_variables or {}
+        self._reconciled_service_config: Optional["ServiceDict"] = None
 
     def _configure_workload(self, event: Union[PebbleReadyEvent, UpgradeCharmEvent]) -> None:
         """If all required relations are ready, configures workload.
@@ -122,13 +151,30 @@ class Orc8rBase(Object):
             event: Juju event (PebbleReadyEvent or UpgradeCharmEvent)
         """
         if not self._relations_created:
-            event.defer()
+            self._defer_once(event)
             return
         if not self._relations_ready:
-            event.defer()
+            self._defer_once(event)
             return
         self._configure_charm(event)
 
+    def _defer_once(self, event: Union[PebbleReadyEvent, UpgradeCharmEvent]) -> None:
+        """Defers the event unless another one is already queued for `_configure_workload`.
+
+        Every event observed by `_configure_workload` leads to the same reconciliation, so
+        keeping a single deferred copy is enough and avoids piling up identical re-runs.
+
+        Args:
+            event: Juju event (PebbleReadyEvent or UpgradeCharmEvent)
+        """
+        for event_path, observer_path, method_name in self.framework._storage.notices():
+            if event_path == event.handle.path:
+                continue
+            if observer_path == self.handle.path and method_name == "_configure_workload":
+                logger.debug(f"Event {event.handle.path} already deferred as {event_path}")
+                return
+        event.defer()
+
     def _on_relation_joined(self, event: RelationJoinedEvent) -> None:
         """Triggered whenever a requirer charm joins the relation provided this charm.
 
@@ -141,53 +187,61 @@ class Orc8rBase(Object):
         """
         if not self.charm.unit.is_leader():
             return
+        service_is_running = self._service_is_running
         self._update_relation_active_status(
-            relation=event.relation, is_active=self._service_is_running
+            relation=event.relation, active=str(service_is_running)
         )
-        if not self._service_is_running:
+        if not service_is_running:
             event.defer()
             return
 
     def _configure_charm(self, event: Union[PebbleReadyEvent, UpgradeCharmEvent]) -> None:
         """Adds layer to pebble config if the proposed config is different from the current one.
 
+        When several events reach this handler during the same hook (e.g. a deferred
+        pebble-ready re-emitted before upgrade-charm), the Pebble plan is only inspected for the
+        first one, later ones reuse the services already reconciled by this instance.
+
         Args:
             event: Juju event (PebbleReadyEvent or UpgradeCharmEvent)
         """
         if self.container.can_connect():
-            self.charm.unit.status = MaintenanceStatus("Configuring pod")
-            pebble_layer = self._pebble_layer
-            plan = self.container.get_plan()
-            if plan.services != pebble_layer.services:
-                self.container.add_layer(self.container_name, pebble_layer, combine=True)
-                self.container.restart(self.service_name)
-                logger.info(f"Restarted container {self.service_name}")
-                self._update_relations()
-            self.charm.unit.status = ActiveStatus()
+            service_config = self._service_config
+            if self._reconciled_service_config != service_config:
+                self.charm.unit.status = MaintenanceStatus("Configuring pod")
+                if not self._plan_matches(self.container.get_plan()):
+                    self.container.add_layer(self.container_name, self._pebble_layer, combine=True)
+                    self.container.restart(self.service_name)
+                    logger.info(f"Restarted container {self.service_name}")
+                    self._update_relations()
+                self._reconciled_service_config = service_config
+            self.charm.unit.status = _ACTIVE_STATUS
         else:
             self.charm.unit.status = WaitingStatus("Waiting for container to be ready...")
-            event.defer()
+            self._defer_once(event)
 
     def _update_relations(self) -> None:
         """Updates relation provided by the charm with the workload service status."""
         if not self.charm.unit.is_leader():
             return
-        relations = self.charm.model.relations[self.charm.meta.name]
+        relations = self.charm.model.relations[self.service_name]
+        active = str(self._service_is_running)
         for relation in relations:
-            self._update_relation_active_status(
-                relation=relation, is_active=self._service_is_running
-            )
+            self._update_relation_active_status(relation=relation, active=active)
 
-    def _update_relation_active_status(self, relation: Relation, is_active: bool) -> None:
-        """Updates service status in the relation data bag.
+    def _update_relation_active_status(self, relation: Relation, active: str) -> None:
+        """Updates service status in the relation data bag, unless it is already up to date.
 
         Args:
             relation: Juju Relation object to update
-            is_active: Workload service status
+            active: Workload service status ("True" or "False")
         """
-        relation.data[self.charm.unit].update(
+        unit_relation_data = relation.data[self.charm.unit]
+        if unit_relation_data.get("active") == active:
+            return
+        unit_relation_data.update(
             {
-                "active": str(is_active),
+                "active": active,
             }
         )
 
@@ -198,13 +252,14 @@ class Orc8rBase(Object):
         Returns:
             bool: Whether the required relations are created
         """
+        if not self.required_relations:
+            return True
+        relations = self.model.relations
         if missing_relations := [
-            relation
-            for relation in self.required_relations
-            if not self.model.get_relation(relation)
+            relation for relation in self.required_relations if not relations.get(relation)
         ]:
             msg = f"Waiting for relation(s) to be created: {', '.join(missing_relations)}"
-            self.charm.unit.status = BlockedStatus(msg)
+            self._set_unit_status(_blocked_status(msg))
             return False
         return True
 
@@ -215,14 +270,26 @@ class Orc8rBase(Object):
         Returns:
             bool: Whether required relations are ready
         """
+        if not self.required_relations:
+            return True
         if missing_relations := [
             relation for relation in self.required_relations if not self._relation_active(relation)
         ]:
             msg = f"Waiting for relation(s) to be ready: {', '.join(missing_relations)}"
-            self.charm.unit.status = WaitingStatus(msg)
+            self._set_unit_status(_waiting_status(msg))
             return False
         return True
 
+    def _set_unit_status(self, status: StatusBase) -> None:
+        """Sets the unit status unless it is already the current one.
+
+        Args:
+            status (StatusBase): Unit status to set
+        """
+        if self.charm.unit.status == status:
+            return
+        self.charm.unit.status = status
+
     @property
     def _pebble_layer(self) -> Layer:
         """Returns pebble layer for the charm.
@@ -234,34 +301,81 @@ class Orc8rBase(Object):
             {
                 "summary": f"{self.service_name} layer",
                 "description": f"pebble config layer for {self.service_name}",
-                "services": {
-                    self.service_name: {
-                        "override": "replace",
-                        "summary": self.service_name,
-                        "startup": "enabled",
-                        "command": self.startup_command,
-                        "environment": self._environment_variables,
-                    }
-                },
+                "services": {self.service_name: self._service_config},
             }
         )
 
     @property
+    def _service_config(self) -> "ServiceDict":
+        """Returns the pebble configuration of the workload service.
+
+        Returns:
+            ServiceDict: Pebble service configuration
+        """
+        return {
+            "override": "replace",
+            "summary": self.service_name,
+            "startup": "enabled",
+            "command": self.startup_command,
+            "environment": self._environment_variables,
+        }
+
+    def _plan_matches(self, plan: Plan) -> bool:
+        """Returns whether the pebble plan only contains the expected workload service.
+
+        Args:
+            plan (Plan): Current pebble plan
+
+        Returns:
+            bool: Whether the plan is up to date
+        """
+        service = plan.services.get(self.service_name)
+        if len(plan.services) != 1 or service is None:
+            return False
+        return self._service_signature(service) == self._expected_service_signature
+
+    @cached_property
+    def _expected_service_signature(self) -> tuple:
+        """Signature of the workload service config, computed once per hook.
+
+        Returns:
+            tuple: Expected service signature
+        """
+        return self._service_signature(Service(self.service_name, self._service_config))
+
+    @staticmethod
+    def _service_signature(service: Service) -> tuple:
+        """Returns the fields of a pebble service that this library manages.
+
+        Args:
+            service (Service): Pebble service
+
+        Returns:
+            tuple: Service override, summary, startup, command and environment
+        """
+        return (
+            service.override,
+            service.summary,
+            service.startup,
+            service.command,
+            tuple(sorted(service.environment.items())),
+        )
+
+    @cached_property
     def _environment_variables(self) -> dict:
         """A set of environment variables required by the workload service.
 
+        Computed once per hook since none of its inputs change during a hook.
+
         Returns:
             dict: Required environment variables
         """
-        environment_variables = {}
-        default_environment_variables = {
+        return {
+            **self.additional_environment_variables,
             "SERVICE_HOSTNAME": self.container_name,
             "SERVICE_REGISTRY_MODE": "k8s",
             "SERVICE_REGISTRY_NAMESPACE": self.namespace,
         }
-        environment_variables.update(self.additional_environment_variables)
-        environment_variables.update(default_environment_variables)
-        return environment_variables
 
     def _relation_active(self, relation_name: str) -> bool:
         """Returns whether a given relation is active or not.
@@ -269,12 +383,11 @@ class Orc8rBase(Object):
         Args:
             relation_name (str): Juju relation name
         """
-        try:
-            rel = self.model.get_relation(relation_name)
-            units = rel.units  # type: ignore[union-attr]
-            return rel.data[next(iter(units))]["active"] == "True"  # type: ignore[union-attr]
-        except (AttributeError, KeyError, StopIteration):
+        rel = self.model.get_relation(relation_name)
+        if rel is None or not rel.units:
             return False
+        unit = next(iter(rel.units))
+        return rel.data[unit].get("active") == "True"
 
     @property
     def _service_is_running(self) -> bool:
@@ -291,6 +404,15 @@ class Orc8rBase(Object):
                 pass
         return False
 
+    @cached_property
+    def container(self) -> Container:
+        """Returns the workload container, only looked up when first needed.
+
+        Returns:
+            Container: Workload container
+        """
+        return self.charm.unit.get_container(self.container_name)
+
     @property
     def namespace(self) -> str:
         """Returns Kubernetes namespace.
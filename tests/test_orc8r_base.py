@@ -87,6 +87,50 @@ class TestCharm(unittest.TestCase):
 
         self.assertEqual(self.harness.charm.unit.status, ActiveStatus())
 
+    @patch("ops.model.Container.restart")
+    @patch("ops.model.Container.add_layer")
+    @patch("ops.model.Container.get_plan")
+    def test_given_pebble_plan_with_stale_environment_when_pebble_ready_then_layer_is_added_and_service_restarted(  # noqa: E501
+        self, patch_get_plan, patch_add_layer, patch_restart
+    ):
+        pebble_plan = {
+            "services": {
+                "magma-orc8r-dummy": {
+                    "override": "replace",
+                    "summary": "magma-orc8r-dummy",
+                    "startup": "enabled",
+                    "command": "/usr/bin/envdir "
+                    "/var/opt/magma/envdir "
+                    "/var/opt/magma/bin/dummy "
+                    "-logtostderr=true "
+                    "-v=0",
+                    "environment": {
+                        "SERVICE_HOSTNAME": "magma-orc8r-dummy",
+                        "SERVICE_REGISTRY_MODE": "k8s",
+                        "SERVICE_REGISTRY_NAMESPACE": "stale-namespace",
+                    },
+                }
+            }
+        }
+        patch_get_plan.return_value = Plan(raw=yaml.dump(pebble_plan))
+
+        self.harness.container_pebble_ready("magma-orc8r-dummy")
+
+        patch_add_layer.assert_called_once()
+        patch_restart.assert_called_once_with("magma-orc8r-dummy")
+
+    @patch("ops.model.Container.get_plan")
+    def test_given_workload_configured_on_pebble_ready_when_upgrade_charm_in_same_hook_then_pebble_plan_is_not_fetched_again(  # noqa: E501
+        self, patch_get_plan
+    ):
+        patch_get_plan.return_value = Plan(raw="{}")
+        self.harness.container_pebble_ready("magma-orc8r-dummy")
+
+        self.harness.charm.on.upgrade_charm.emit()
+
+        patch_get_plan.assert_called_once()
+        self.assertEqual(self.harness.charm.unit.status, ActiveStatus())
+
     def test_given_workload_not_running_when_relation_joined_then_service_status_is_marked_as_not_active_in_relation_data(  # noqa: E501
         self,
     ):
@@ -120,6 +164,30 @@ class TestCharm(unittest.TestCase):
         expected_relation_data = {"active": "True"}
         self.assertEqual(expected_relation_data, relation_data)
 
+    def test_given_active_status_already_in_relation_data_when_relations_updated_then_relation_data_is_not_rewritten(  # noqa: E501
+        self,
+    ):
+        self.harness.set_leader(True)
+        relation_id = self.harness.add_relation("magma-orc8r-dummy", "remote-app")
+        self.harness.add_relation_unit(relation_id, "remote-app/0")
+
+        with patch("ops.model.RelationDataContent.update") as patch_update:
+            self.harness.charm._orc8r_base._update_relations()
+
+        patch_update.assert_not_called()
+
+    def test_given_active_status_already_in_relation_data_when_relation_joined_then_relation_data_is_not_rewritten(  # noqa: E501
+        self,
+    ):
+        self.harness.set_leader(True)
+        relation_id = self.harness.add_relation("magma-orc8r-dummy", "remote-app")
+        self.harness.add_relation_unit(relation_id, "remote-app/0")
+
+        with patch("ops.model.RelationDataContent.update") as patch_update:
+            self.harness.add_relation_unit(relation_id, "remote-app/1")
+
+        patch_update.assert_not_called()
+
     def test_given_magma_orc8r_orchestrator_service_running_when_metrics_magma_orc8r_orchestrator_relation_joined_event_emitted_then_active_key_in_relation_data_is_set_to_true(  # noqa: E501
         self,
     ):
@@ -177,6 +245,19 @@ class TestCharmWithRequiredRelation(unittest.TestCase):
 
         patch_defer.assert_called()
 
+    def test_given_relation_is_not_created_when_upgrade_charm_emitted_twice_then_only_one_event_is_deferred(  # noqa: E501
+        self,
+    ):
+        self.harness.charm.on.upgrade_charm.emit()
+        self.harness.charm.on.upgrade_charm.emit()
+
+        deferred_notices = [
+            notice
+            for notice in self.harness.framework._storage.notices()
+            if notice[2] == "_configure_workload"
+        ]
+        self.assertEqual(len(deferred_notices), 1)
+
     def test_given_relation_is_not_created_when_upgrade_charm_then_status_is_blocked(self):
         self.harness.charm.on.upgrade_charm.emit()
 
@@ -185,6 +266,32 @@ class TestCharmWithRequiredRelation(unittest.TestCase):
             BlockedStatus("Waiting for relation(s) to be created: magma-orc8r-whatever"),
         )
 
+    def test_given_relation_is_not_created_when_upgrade_charm_emitted_twice_then_blocked_status_is_set_once(  # noqa: E501
+        self,
+    ):
+        self.harness.charm.on.upgrade_charm.emit()
+
+        with patch.object(self.harness._backend, "status_set") as patch_status_set:
+            self.harness.charm.on.upgrade_charm.emit()
+
+        patch_status_set.assert_not_called()
+        self.assertEqual(
+            self.harness.charm.unit.status,
+            BlockedStatus("Waiting for relation(s) to be created: magma-orc8r-whatever"),
+        )
+
+    def test_given_relation_created_but_not_ready_when_upgrade_charm_emitted_twice_then_waiting_status_is_set_once(  # noqa: E501
+        self,
+    ):
+        relation_id = self.harness.add_relation("magma-orc8r-whatever", "remote-app")
+        self.harness.add_relation_unit(relation_id, "remote-app/0")
+        self.harness.charm.on.upgrade_charm.emit()
+
+        with patch.object(self.harness._backend, "status_set") as patch_status_set:
+            self.harness.charm.on.upgrade_charm.emit()
+
+        patch_status_set.assert_not_called()
+
     @patch("ops.charm.UpgradeCharmEvent.defer")
     def test_given_relation_created_but_not_ready_when_upgrade_charm_then_event_is_deferred(
         self, patch_defer